@@ -2,25 +2,61 @@
 
 from __future__ import annotations
 
-import json
+import queue
 import subprocess
-from collections.abc import Iterator
+import tempfile
+import threading
+import wave
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cache
+from importlib.util import find_spec
+from typing import BinaryIO, TypeVar, cast
 
 import numpy as np
 
+T = TypeVar("T")
+
+_PREFETCH_END = object()
+
+PIPE_BUFSIZE = 1 << 20
+
+_FFMPEG_QUIET = ("ffmpeg", "-nostdin", "-hide_banner", "-nostats", "-loglevel", "error")
+_PCM_F32_MONO = ("-f", "f32le", "-ac", "1")
+
+_SECONDS_LABELS = tuple(f"{i}s" for i in range(60))
+
+# Indexed by which of (hours, minutes, seconds) are nonzero, as a 3-bit mask.
+_DURATION_FORMATS: tuple[Callable[[int, int, int], str], ...] = (
+    lambda h, m, s: "0s",
+    lambda h, m, s: f"{s}s",
+    lambda h, m, s: f"{m}m",
+    lambda h, m, s: f"{m}m {s}s",
+    lambda h, m, s: f"{h}h",
+    lambda h, m, s: f"{h}h {s}s",
+    lambda h, m, s: f"{h}h {m}m",
+    lambda h, m, s: f"{h}h {m}m {s}s",
+)
+
 
 def probe_duration(file_path: str) -> float:
-    """Get audio file duration in seconds using ffprobe."""
+    """Get audio file duration in seconds, from the WAV header or else ffprobe."""
+    try:
+        with wave.open(file_path, "rb") as wav:
+            return wav.getnframes() / wav.getframerate()
+    except (wave.Error, EOFError):
+        pass
+
     cmd = [
         "ffprobe",
-        "-v", "quiet",
-        "-print_format", "json",
-        "-show_format",
+        "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
         file_path,
     ]
     result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    info = json.loads(result.stdout)
-    return float(info["format"]["duration"])
+    return float(result.stdout)
 
 
 def load_audio_segment(
@@ -28,20 +64,16 @@ def load_audio_segment(
     start_sec: float,
     duration_sec: float,
     sample_rate: int = 16000,
+    threads: int = 0,
 ) -> np.ndarray:
-    """Load a segment of audio as float32 mono at given sample rate via ffmpeg."""
-    cmd = [
-        "ffmpeg", "-nostdin",
-        "-ss", str(start_sec),
-        "-t", str(duration_sec),
-        "-i", file_path,
-        "-f", "f32le",
-        "-ac", "1",
-        "-ar", str(sample_rate),
-        "-",
-    ]
-    result = subprocess.run(cmd, capture_output=True, check=True)
-    return np.frombuffer(result.stdout, dtype=np.float32)
+    """Load a segment of audio as float32 mono at given sample rate via ffmpeg.
+
+    threads sets ffmpeg's decoder threads; 0 lets ffmpeg choose. Pass 1 when
+    the caller already keeps every core busy, e.g. with torch inference.
+    """
+    source = ["-ss", str(start_sec), "-t", str(duration_sec), "-i", file_path]
+    with _decode_pcm(source, sample_rate, threads) as stdout:
+        return _read_pcm(stdout, int(round(duration_sec * sample_rate)))
 
 
 def stream_chunks(
@@ -49,44 +81,154 @@ def stream_chunks(
     chunk_duration_sec: int = 300,
     overlap_sec: int = 2,
     sample_rate: int = 16000,
+    threads: int = 0,
 ) -> Iterator[tuple[float, np.ndarray]]:
-    """Yield (chunk_start_sec, audio_array) for each chunk of the file."""
-    total_sec = probe_duration(file_path)
+    """Yield (chunk_start_sec, audio_array) for each chunk of the file.
+
+    The whole file is decoded by one ffmpeg process. Each chunk after the first
+    starts with the last overlap_sec of the previous chunk, reused from memory.
+    threads is passed to the decoder as in load_audio_segment.
+    """
+    chunk_n = chunk_duration_sec * sample_rate
+    overlap_n = overlap_sec * sample_rate
+    tail = np.empty(0, dtype=np.float32)
     pos = 0.0
 
-    while pos < total_sec:
-        read_start = max(0.0, pos - overlap_sec) if pos > 0 else 0.0
-        read_duration = chunk_duration_sec + (overlap_sec if pos > 0 else 0)
-        read_duration = min(read_duration, total_sec - read_start)
+    with _decode_pcm(["-i", file_path], sample_rate, threads) as stdout:
+        while True:
+            audio = np.empty(tail.size + chunk_n, dtype=np.float32)
+            audio[: tail.size] = tail
+            n_read = _fill(stdout, audio[tail.size :])
+            if n_read == 0:
+                return
+            audio = audio[: tail.size + n_read]
+            yield pos - tail.size / sample_rate, audio
+
+            tail = audio[audio.size - min(overlap_n, audio.size) :]
+            pos += chunk_duration_sec
+
 
-        audio = load_audio_segment(file_path, read_start, read_duration, sample_rate)
-        yield read_start, audio
+@contextmanager
+def _decode_pcm(source: list[str], sample_rate: int, threads: int) -> Iterator[BinaryIO]:
+    """Decode source to float32 mono PCM with ffmpeg and yield its stdout.
 
-        pos += chunk_duration_sec
+    Raises CalledProcessError if ffmpeg fails. With -loglevel error, stderr only
+    holds real errors. It goes to a temporary file, so it can never fill a pipe
+    and stall the decoder.
+    """
+    cmd = [
+        *_FFMPEG_QUIET, "-threads", str(threads),
+        *source,
+        *_PCM_F32_MONO, "-ar", str(sample_rate), "-",
+    ]
+    with tempfile.TemporaryFile() as stderr:
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=stderr, bufsize=PIPE_BUFSIZE
+        ) as proc:
+            yield cast(BinaryIO, proc.stdout)
+        if proc.returncode != 0:
+            stderr.seek(0)
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr.read())
+
+
+def _fill(stream: BinaryIO, buf: np.ndarray) -> int:
+    """Read from stream into buf until it is full or EOF; return whole samples read."""
+    view = memoryview(buf).cast("B")
+    filled = 0
+    while filled < len(view):
+        n = stream.readinto(view[filled:])
+        if not n:
+            break
+        filled += n
+    return filled // buf.itemsize
+
+
+def _read_pcm(stream: BinaryIO, expected: int) -> np.ndarray:
+    """Read float32 samples from stream to EOF straight into a preallocated array.
+
+    The array starts at the expected sample count and doubles if the decoder
+    produces more, so the PCM bytes are never held twice.
+    """
+    out = np.empty(max(expected, 1), dtype=np.float32)
+    n_read = _fill(stream, out)
+    while n_read == out.size:
+        grown = np.empty(out.size * 2, dtype=np.float32)
+        grown[:n_read] = out
+        out = grown
+        n_read += _fill(stream, out[n_read:])
+    return out[:n_read]
+
+
+@dataclass(frozen=True)
+class _PrefetchError:
+    error: Exception
+
+
+def prefetch(items: Iterable[T], size: int = 2) -> Iterator[T]:
+    """Yield from items while a background thread produces up to `size` ahead.
+
+    Lets ffmpeg decode the next chunk while the caller runs inference on the
+    current one. Exceptions raised by the producer are re-raised here.
+    """
+    buffer: queue.Queue[object] = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except Exception as exc:
+            put(_PrefetchError(exc))
+            return
+        put(_PREFETCH_END)
+
+    producer = threading.Thread(target=produce, name="prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_END:
+                return
+            if isinstance(item, _PrefetchError):
+                raise item.error
+            yield cast(T, item)
+    finally:
+        stop.set()
 
 
 def format_duration(seconds: float) -> str:
     """Format a duration in seconds as human-readable (e.g. '1h 2m 5s')."""
     total = int(seconds)
     if total < 60:
-        return f"{total}s"
-    hours = total // 3600
-    minutes = (total % 3600) // 60
-    secs = total % 60
-    parts: list[str] = []
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if secs > 0:
-        parts.append(f"{secs}s")
-    return " ".join(parts)
+        return _SECONDS_LABELS[total] if total >= 0 else f"{total}s"
+    hours, rem = divmod(total, 3600)
+    minutes, secs = divmod(rem, 60)
+    mask = (hours > 0) << 2 | (minutes > 0) << 1 | (secs > 0)
+    return _DURATION_FORMATS[mask](hours, minutes, secs)
 
 
 def detect_device(requested: str) -> str:
     """Resolve device string; when 'auto', pick cuda > mps > cpu."""
     if requested != "auto":
         return requested
+    return _detect_auto()
+
+
+@cache
+def _detect_auto() -> str:
+    """Probe the available accelerators once per process."""
+    if find_spec("torch") is None:
+        return "cpu"
     import torch
 
     if torch.cuda.is_available():
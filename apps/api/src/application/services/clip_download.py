@@ -0,0 +1,23 @@
+"""Fetch a run's clips from storage into a local directory."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from domain.ports.storage import AudioStorage
+
+DOWNLOAD_WORKERS = 16
+
+
+def download_missing(
+    storage: AudioStorage, run_id: str, dest_dir: Path, file_names: Iterable[str]
+) -> None:
+    """Download the given clips that are not already present in dest_dir."""
+    missing = [name for name in file_names if not (dest_dir / name).exists()]
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        list(executor.map(
+            lambda name: storage.download(run_id, name, dest_dir / name),
+            missing,
+        ))
@@ -2,21 +2,53 @@
 
 from __future__ import annotations
 
+import csv
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 import soundfile as sf
 
-from application.services.audio_processing import stream_chunks
-from domain.entities.clip import AudioSegment, ClipCandidate, ClipResult
+from application.services.audio_processing import prefetch, stream_chunks
+from domain.entities.clip import AudioSegment, ClipCandidate
 from domain.ports.classifier import ClassifierPort
 from domain.ports.transcriber import TranscriberPort
 from domain.ports.vad import VADPort
 
 MUSIC_SCORE_WEIGHT = 0.8
-NO_SPEECH_THRESHOLD = 0.6
+PCM16_SCALE = 32768
+METADATA_COLUMNS = [
+    "file_name",
+    "source_file",
+    "start_sec",
+    "end_sec",
+    "duration_sec",
+    "speech_score",
+    "music_score",
+    "transcription",
+]
+
+
+class _Pcm16Writer:
+    """Write float clips as PCM16 WAVs through reusable scratch buffers."""
+
+    def __init__(self, capacity: int) -> None:
+        self._f32 = np.empty(capacity, dtype=np.float32)
+        self._i16 = np.empty(capacity, dtype=np.int16)
+
+    def write(self, path: Path, audio: np.ndarray, sample_rate: int) -> None:
+        n = len(audio)
+        if n > len(self._i16):
+            self._f32 = np.empty(n, dtype=np.float32)
+            self._i16 = np.empty(n, dtype=np.int16)
+        scaled = self._f32[:n]
+        np.multiply(audio, PCM16_SCALE, out=scaled, casting="unsafe")
+        np.clip(scaled, -PCM16_SCALE, PCM16_SCALE - 1, out=scaled)
+        np.floor(scaled, out=scaled)
+        pcm = self._i16[:n]
+        np.copyto(pcm, scaled, casting="unsafe")
+        sf.write(str(path), pcm, sample_rate, subtype="PCM_16")
 
 
 def group_segments(
@@ -82,6 +114,7 @@ def run_pipeline(
 ) -> Path | None:
     """Run the full clip extraction pipeline. Returns the output directory path."""
     source = Path(input_file)
+    source_name = str(source)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     label = run_label or source.stem
     run_dir_name = f"{timestamp}_{label}"
@@ -89,69 +122,61 @@ def run_pipeline(
     clips_dir = out / "clips"
     clips_dir.mkdir(parents=True, exist_ok=True)
 
-    rows: list[dict[str, object]] = []
     counter = 0
-
-    for chunk_start, audio in stream_chunks(
-        input_file, chunk_duration, sample_rate=sample_rate
-    ):
-        segments = [
-            AudioSegment(
-                start_sec=seg.start_sec + chunk_start,
-                end_sec=seg.end_sec + chunk_start,
-            )
-            for seg in vad.detect(audio, sample_rate)
-        ]
-
-        candidates = group_segments(
-            segments, audio, sample_rate, source, audio_start_sec=chunk_start
-        )
-
-        for candidate in candidates:
-            speech_score, music_score = classifier.classify(
-                candidate.audio, sample_rate
-            )
-            accepted = (
-                speech_score > speech_threshold
-                and speech_score > music_score * MUSIC_SCORE_WEIGHT
+    writer = _Pcm16Writer(30 * sample_rate)
+    metadata: csv.DictWriter[str] | None = None
+
+    with ExitStack() as stack:
+        for chunk_start, audio in prefetch(
+            stream_chunks(input_file, chunk_duration, sample_rate=sample_rate)
+        ):
+            segments = [
+                AudioSegment(
+                    start_sec=seg.start_sec + chunk_start,
+                    end_sec=seg.end_sec + chunk_start,
+                )
+                for seg in vad.detect(audio, sample_rate)
+            ]
+
+            candidates = group_segments(
+                segments, audio, sample_rate, source, audio_start_sec=chunk_start
             )
 
-            if not accepted:
+            if not candidates:
                 continue
 
-            result_dict = transcriber.transcribe(candidate.audio, sample_rate)
-            whisper_rejected = result_dict["no_speech_prob"] > NO_SPEECH_THRESHOLD
-
-            counter += 1
-            clip_name = f"clip_{counter:05d}.wav"
-            clip_path = clips_dir / clip_name
-            sf.write(str(clip_path), candidate.audio, sample_rate, subtype="PCM_16")
-
-            clip_result = ClipResult(
-                candidate=candidate,
-                speech_score=speech_score,
-                music_score=music_score,
-                accepted=True,
-                whisper_text=result_dict["text"],
-                whisper_avg_logprob=result_dict["avg_logprob"],
-                whisper_no_speech_prob=result_dict["no_speech_prob"],
-                whisper_rejected=whisper_rejected,
-                clip_path=clip_path,
+            scores = np.array(
+                [classifier.classify(c.audio, sample_rate) for c in candidates],
+                dtype=np.float64,
+            )
+            speech_scores, music_scores = scores[:, 0], scores[:, 1]
+            accepted_mask = (speech_scores > speech_threshold) & (
+                speech_scores > music_scores * MUSIC_SCORE_WEIGHT
             )
 
-            rows.append({
-                "file_name": f"clips/{clip_name}",
-                "source_file": str(clip_result.candidate.source_file),
-                "start_sec": round(clip_result.candidate.start_sec, 2),
-                "end_sec": round(clip_result.candidate.end_sec, 2),
-                "duration_sec": round(clip_result.candidate.duration, 2),
-                "speech_score": round(clip_result.speech_score, 3),
-                "music_score": round(clip_result.music_score, 3),
-                "transcription": clip_result.whisper_text or "",
-            })
-
-    if rows:
-        df = pd.DataFrame(rows)
-        df.to_csv(out / "metadata.csv", index=False)
-
-    return out if rows else None
+            for idx in np.flatnonzero(accepted_mask):
+                candidate = candidates[idx]
+                result_dict = transcriber.transcribe(candidate.audio, sample_rate)
+
+                counter += 1
+                clip_name = f"clip_{counter:05d}.wav"
+                writer.write(clips_dir / clip_name, candidate.audio, sample_rate)
+
+                if metadata is None:
+                    handle = stack.enter_context(
+                        (out / "metadata.csv").open("w", newline="")
+                    )
+                    metadata = csv.DictWriter(handle, fieldnames=METADATA_COLUMNS)
+                    metadata.writeheader()
+                metadata.writerow({
+                    "file_name": f"clips/{clip_name}",
+                    "source_file": source_name,
+                    "start_sec": round(candidate.start_sec, 2),
+                    "end_sec": round(candidate.end_sec, 2),
+                    "duration_sec": round(candidate.duration, 2),
+                    "speech_score": round(float(speech_scores[idx]), 3),
+                    "music_score": round(float(music_scores[idx]), 3),
+                    "transcription": result_dict["text"] or "",
+                })
+
+    return out if counter else None
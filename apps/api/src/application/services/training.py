@@ -88,6 +88,7 @@ class RichProgressCallback(TrainerCallback):
             TextColumn("VRAM={task.fields[vram]}"),
             TimeRemainingColumn(),
             console=console,
+            refresh_per_second=4,
         )
         self.progress.start()
         self.task_id = self.progress.add_task(
@@ -264,10 +265,7 @@ def redraft_pending(
     )
     start_time = time.perf_counter()
 
-    processor = WhisperProcessor.from_pretrained(model_path)
-    model = WhisperForConditionalGeneration.from_pretrained(model_path)
-    model.to(device).eval()
-    logger.debug("Model loaded and moved to %s", device)
+    processor, model = load_whisper(model_path, device)
 
     forced_decoder_ids = processor.get_decoder_prompt_ids(language=language, task="transcribe")
 
@@ -305,8 +303,13 @@ def get_transcriptions(
     pending_clips: list[dict[str, str]],
     device: str,
     language: str = "mg",
+    *,
+    whisper: tuple[WhisperProcessor, WhisperForConditionalGeneration] | None = None,
 ) -> list[tuple[str, str]]:
-    """Transcribe clips and return list of (clip_id, text) pairs."""
+    """Transcribe clips and return list of (clip_id, text) pairs.
+
+    Pass whisper from load_whisper to reuse one loaded model across calls.
+    """
     logger.info(
         "Transcription started: %d clips, model=%s, device=%s",
         len(pending_clips),
@@ -315,10 +318,7 @@ def get_transcriptions(
     )
     start_time = time.perf_counter()
 
-    processor = WhisperProcessor.from_pretrained(model_path)
-    model = WhisperForConditionalGeneration.from_pretrained(model_path)
-    model.to(device).eval()
-    logger.debug("Model loaded and moved to %s", device)
+    processor, model = whisper if whisper is not None else load_whisper(model_path, device)
 
     forced_decoder_ids = processor.get_decoder_prompt_ids(language=language, task="transcribe")
 
@@ -341,6 +341,17 @@ def get_transcriptions(
     return results
 
 
+def load_whisper(
+    model_path: str, device: str
+) -> tuple[WhisperProcessor, WhisperForConditionalGeneration]:
+    """Load a Whisper checkpoint and move it to device for inference."""
+    processor = WhisperProcessor.from_pretrained(model_path)
+    model = WhisperForConditionalGeneration.from_pretrained(model_path)
+    model.to(device).eval()
+    logger.debug("Model %s loaded and moved to %s", model_path, device)
+    return processor, model
+
+
 def _transcribe_clip(
     wav_path: Path,
     processor: WhisperProcessor,
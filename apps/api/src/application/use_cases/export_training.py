@@ -2,19 +2,46 @@
 
 from __future__ import annotations
 
-import random
+import csv
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
 
+from application.services.clip_download import download_missing
 from domain.entities.clip import ClipStatus
-from domain.exceptions import SyncError
+from domain.entities.run import Run
+from domain.exceptions import RunNotFoundError, SyncError
 from domain.ports.clip_repository import ClipRepository
 from domain.ports.run_repository import RunRepository
 from domain.ports.storage import AudioStorage
 
+COPY_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+LOOKUP_WORKERS = 4
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, copying instead when they sit on different filesystems.
+
+    Linked clips share data with the source run, so editing one changes both.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _list_dir(directory: Path) -> set[str]:
+    """Return the entry names in directory, or an empty set if it does not exist."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
 
 class ExportTraining:
     def __init__(
@@ -38,19 +65,24 @@ class ExportTraining:
 
         Silently overwrites existing output. Returns dataset directory path.
         """
-        all_rows: list[dict[str, object]] = []
-        all_source_dirs: dict[str, Path] = {}
-
-        for run_id in run_ids:
-            label = self._run_repo.resolve_label(run_id)
-            source_dir = self._ensure_source_dir(run_id, label)
-            all_source_dirs[run_id] = source_dir
+        with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+            row_futures = [
+                executor.submit(
+                    self._clip_repo.find_by_run,
+                    run_id,
+                    status=ClipStatus.CORRECTED,
+                    columns="file_name,corrected_transcription",
+                )
+                for run_id in run_ids
+            ]
+            runs = list(executor.map(self._find_run, run_ids))
+            # One run at a time: each already downloads in parallel, and runs
+            # sharing a label share a destination directory.
+            source_dirs = [self._ensure_source_dir(run) for run in runs]
+            row_lists = [future.result() for future in row_futures]
 
-            rows = self._clip_repo.find_by_run(
-                run_id,
-                status=ClipStatus.CORRECTED,
-                columns="file_name,corrected_transcription",
-            )
+        all_rows: list[dict[str, object]] = []
+        for source_dir, rows in zip(source_dirs, row_lists, strict=True):
             for row in rows:
                 row["_source_dir"] = source_dir
             all_rows.extend(rows)
@@ -60,21 +92,17 @@ class ExportTraining:
 
         self._validate_source_files(all_rows)
 
-        labels = [self._run_repo.resolve_label(rid) for rid in run_ids]
-        combined_label = "_".join(labels)
+        combined_label = "_".join(run.label for run in runs)
         timestamp = datetime.now(tz=UTC).strftime("%Y%m%d")
         dataset_dir = output_dir / f"{timestamp}_{combined_label}"
 
         if dataset_dir.exists():
             shutil.rmtree(dataset_dir)
 
-        rng = random.Random(seed)
-        shuffled = list(all_rows)
-        rng.shuffle(shuffled)
-
-        split_idx = max(1, int(len(shuffled) * (1 - eval_split)))
-        train_rows = shuffled[:split_idx]
-        test_rows = shuffled[split_idx:]
+        order = np.random.default_rng(seed).permutation(len(all_rows))
+        split_idx = max(1, int(len(all_rows) * (1 - eval_split)))
+        train_rows = [all_rows[i] for i in order[:split_idx]]
+        test_rows = [all_rows[i] for i in order[split_idx:]]
 
         self._write_split(dataset_dir / "train", train_rows)
         if test_rows:
@@ -82,37 +110,40 @@ class ExportTraining:
 
         return dataset_dir
 
-    def _ensure_source_dir(self, run_id: str, label: str) -> Path:
+    def _find_run(self, run_id: str) -> Run:
         run = self._run_repo.find_by_id(run_id)
-        if run and run.source:
+        if run is None:
+            raise RunNotFoundError(f"No run found with id '{run_id}'")
+        return run
+
+    def _ensure_source_dir(self, run: Run) -> Path:
+        if run.source:
             stored_path = Path(run.source)
-            if stored_path.exists() and (stored_path / "clips").is_dir():
+            if (stored_path / "clips").is_dir():
                 return stored_path
 
-        dest_dir = Path("data/output") / label
+        dest_dir = Path("data/output") / run.label
         clips = self._clip_repo.find_by_run(
-            run_id, columns="file_name"
+            run.id, columns="file_name"
         )
         file_names = [
             str(row["file_name"])
             for row in clips
             if str(row["file_name"]).endswith(".wav")
         ]
-
-        for file_name in file_names:
-            local_path = dest_dir / file_name
-            if not local_path.exists():
-                self._storage.download(run_id, file_name, local_path)
-
+        download_missing(self._storage, run.id, dest_dir, file_names)
         return dest_dir
 
     @staticmethod
     def _validate_source_files(rows: list[dict[str, object]]) -> None:
-        missing = [
-            str(r["file_name"])
-            for r in rows
-            if not (Path(str(r["_source_dir"])) / str(r["file_name"])).exists()
-        ]
+        listings: dict[Path, set[str]] = {}
+        missing: list[str] = []
+        for r in rows:
+            path = Path(str(r["_source_dir"])) / str(r["file_name"])
+            if path.parent not in listings:
+                listings[path.parent] = _list_dir(path.parent)
+            if path.name not in listings[path.parent]:
+                missing.append(str(r["file_name"]))
         if missing:
             raise SyncError(
                 f"{len(missing)} clip files not found. First missing: {missing[0]}"
@@ -123,15 +154,14 @@ class ExportTraining:
         split_dir: Path, rows: list[dict[str, object]]
     ) -> None:
         split_dir.mkdir(parents=True)
-        for row in rows:
-            src = Path(str(row["_source_dir"])) / str(row["file_name"])
-            shutil.copy2(src, split_dir / src.name)
-
-        df = pd.DataFrame([
-            {
-                "file_name": Path(str(row["file_name"])).name,
-                "transcription": row["corrected_transcription"],
-            }
-            for row in rows
-        ])
-        df.to_csv(split_dir / "metadata.csv", index=False)
+        sources = [Path(str(row["_source_dir"])) / str(row["file_name"]) for row in rows]
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            list(executor.map(lambda src: _link_or_copy(src, split_dir / src.name), sources))
+
+        with (split_dir / "metadata.csv").open("w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["file_name", "transcription"])
+            writer.writerows(
+                (src.name, row["corrected_transcription"])
+                for src, row in zip(sources, rows, strict=True)
+            )
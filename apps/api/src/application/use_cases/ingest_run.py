@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
+from opentelemetry import trace
+
 from application.services.clip_extraction import run_pipeline
 from application.use_cases.sync_run import SyncRun
 from domain.ports.classifier import ClassifierPort
@@ -14,6 +19,18 @@ from domain.ports.transcriber import TranscriberPort
 from domain.ports.vad import VADPort
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+
+@contextmanager
+def _timed(stage: str, timings: dict[str, float]) -> Iterator[None]:
+    """Trace an ingest stage as a span and record its wall-clock seconds."""
+    start = time.monotonic()
+    with tracer.start_as_current_span(f"ingest.{stage}"):
+        try:
+            yield
+        finally:
+            timings[stage] = time.monotonic() - start
 
 
 class IngestRun:
@@ -44,6 +61,7 @@ class IngestRun:
         speech_threshold: float = 0.35,
     ) -> None:
         """Run the full ingest pipeline with job progress tracking."""
+        timings: dict[str, float] = {}
         try:
             self._job_repo.update(
                 job_id,
@@ -51,20 +69,22 @@ class IngestRun:
                 progress=0,
                 progress_message="Downloading from YouTube...",
             )
-            audio_path = self._downloader.download(url, input_dir, label)
+            with _timed("download", timings):
+                audio_path = self._downloader.download(url, input_dir, label)
 
             self._job_repo.update(
                 job_id, progress=30, progress_message="Extracting clips..."
             )
-            run_dir = run_pipeline(
-                str(audio_path),
-                str(output_dir),
-                self._vad,
-                self._classifier,
-                self._transcriber,
-                speech_threshold=speech_threshold,
-                run_label=label,
-            )
+            with _timed("extract", timings):
+                run_dir = run_pipeline(
+                    str(audio_path),
+                    str(output_dir),
+                    self._vad,
+                    self._classifier,
+                    self._transcriber,
+                    speech_threshold=speech_threshold,
+                    run_label=label,
+                )
             if run_dir is None:
                 self._job_repo.fail(job_id, "Pipeline returned no output directory")
                 return
@@ -72,7 +92,13 @@ class IngestRun:
             self._job_repo.update(
                 job_id, progress=80, progress_message="Syncing to database..."
             )
-            run_id = self._sync.execute(run_dir, label)
+            with _timed("sync", timings):
+                run_id = self._sync.execute(run_dir, label)
+            logger.info(
+                "Ingest job %s stage timings: %s",
+                job_id,
+                ", ".join(f"{stage}={sec:.1f}s" for stage, sec in timings.items()),
+            )
 
             self._job_repo.update(
                 job_id,
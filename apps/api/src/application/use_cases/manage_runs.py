@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 from domain.ports.clip_repository import ClipRepository
 from domain.ports.run_repository import RunRepository
 from domain.ports.storage import AudioStorage
 
+STORAGE_WORKERS = 16
+
 
 class DeleteRun:
     def __init__(
@@ -37,9 +41,9 @@ class Cleanup:
         empty_run_ids: list[str],
         orphan_prefixes: list[str],
     ) -> None:
+        prefixes = [*empty_run_ids, *orphan_prefixes]
+        with ThreadPoolExecutor(max_workers=STORAGE_WORKERS) as executor:
+            list(executor.map(self._storage.remove_prefix, prefixes))
+
         for run_id in empty_run_ids:
-            self._storage.remove_prefix(run_id)
             self._run_repo.delete(run_id)
-
-        for prefix in orphan_prefixes:
-            self._storage.remove_prefix(prefix)
@@ -5,8 +5,11 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from application.services.training import get_transcriptions
+from application.services.clip_download import download_missing
+from application.services.training import get_transcriptions, load_whisper
 from domain.entities.clip import ClipStatus
+from domain.entities.run import Run
+from domain.exceptions import RunNotFoundError
 from domain.ports.clip_repository import ClipRepository
 from domain.ports.job_repository import JobRepository
 from domain.ports.run_repository import RunRepository
@@ -46,9 +49,13 @@ class RedraftClips:
             )
 
             total_updated = 0
+            whisper = None
             for i, run_id in enumerate(run_ids):
-                label = self._run_repo.resolve_label(run_id)
-                source_dir = self._ensure_source_dir(run_id, label)
+                run = self._run_repo.find_by_id(run_id)
+                if run is None:
+                    raise RunNotFoundError(f"No run found with id '{run_id}'")
+                label = run.label
+                source_dir = self._ensure_source_dir(run)
 
                 pending = self._clip_repo.find_by_run(
                     run_id,
@@ -66,8 +73,10 @@ class RedraftClips:
                     progress_message=f"Re-drafting {label} ({len(pending)} clips)...",
                 )
 
+                if whisper is None:
+                    whisper = load_whisper(model_path, device)
                 transcriptions = get_transcriptions(
-                    model_path, source_dir, pending, device, language
+                    model_path, source_dir, pending, device, language, whisper=whisper
                 )
 
                 for clip_id, text in transcriptions:
@@ -84,19 +93,18 @@ class RedraftClips:
             logger.exception("Redraft job %s failed: %s", job_id, exc)
             self._job_repo.fail(job_id, str(exc))
 
-    def _ensure_source_dir(self, run_id: str, label: str) -> Path:
-        run = self._run_repo.find_by_id(run_id)
-        if run and run.source:
+    def _ensure_source_dir(self, run: Run) -> Path:
+        if run.source:
             stored_path = Path(run.source)
-            if stored_path.exists() and (stored_path / "clips").is_dir():
+            if (stored_path / "clips").is_dir():
                 return stored_path
 
-        dest_dir = Path("data/output") / label
-        clips = self._clip_repo.find_by_run(run_id, columns="file_name")
-        for row in clips:
-            file_name = str(row["file_name"])
-            if file_name.endswith(".wav"):
-                local_path = dest_dir / file_name
-                if not local_path.exists():
-                    self._storage.download(run_id, file_name, local_path)
+        dest_dir = Path("data/output") / run.label
+        clips = self._clip_repo.find_by_run(run.id, columns="file_name")
+        file_names = [
+            str(row["file_name"])
+            for row in clips
+            if str(row["file_name"]).endswith(".wav")
+        ]
+        download_missing(self._storage, run.id, dest_dir, file_names)
         return dest_dir
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
@@ -12,6 +13,8 @@ from domain.ports.clip_repository import ClipRepository
 from domain.ports.run_repository import RunRepository
 from domain.ports.storage import AudioStorage
 
+UPLOAD_WORKERS = 8
+
 CSV_TO_DB_COLUMNS: dict[str, str] = {
     "file_name": "file_name",
     "source_file": "source_file",
@@ -48,20 +51,18 @@ class SyncRun:
         run_id = self._run_repo.create(label, str(run_dir), RunType.EXTRACTION)
 
         wav_files = sorted(clips_dir.glob("*.wav"))
-        for wav in wav_files:
-            self._storage.upload(run_id, f"clips/{wav.name}", wav)
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+            list(executor.map(
+                lambda wav: self._storage.upload(run_id, f"clips/{wav.name}", wav),
+                wav_files,
+            ))
 
         self._upsert_metadata(run_id, metadata_path)
         return run_id
 
     def _upsert_metadata(self, run_id: str, metadata_path: Path) -> None:
         df = pd.read_csv(metadata_path)
-        rows: list[dict[str, object]] = []
-        for _, csv_row in df.iterrows():
-            db_row: dict[str, object] = {}
-            for csv_col, db_col in CSV_TO_DB_COLUMNS.items():
-                if csv_col in csv_row.index:
-                    value = csv_row[csv_col]
-                    db_row[db_col] = None if pd.isna(value) else value
-            rows.append(db_row)
+        df = df[[col for col in CSV_TO_DB_COLUMNS if col in df.columns]]
+        df = df.rename(columns=CSV_TO_DB_COLUMNS)
+        rows = df.astype(object).where(df.notna(), None).to_dict(orient="records")
         self._clip_repo.upsert_batch(run_id, rows)
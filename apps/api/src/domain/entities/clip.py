@@ -32,7 +32,7 @@ class Clip:
     priority: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioSegment:
     """A VAD-detected speech region in absolute file time (seconds)."""
 
@@ -44,7 +44,7 @@ class AudioSegment:
         return self.end_sec - self.start_sec
 
 
-@dataclass
+@dataclass(slots=True)
 class ClipCandidate:
     """Grouped VAD segments forming a 5-30s clip ready for classification."""
 
@@ -65,7 +65,7 @@ class ClipCandidate:
         return self.end_sec - self.start_sec
 
 
-@dataclass
+@dataclass(slots=True)
 class ClipResult:
     """A classified and optionally transcribed clip."""
 
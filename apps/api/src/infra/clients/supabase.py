@@ -5,14 +5,21 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+import httpx
 from dotenv import load_dotenv
 from supabase import Client, create_client
+from supabase.lib.client_options import SyncClientOptions
 
 from domain.exceptions import MissingConfigError
 
+# Keep idle connections around long enough to be reused across paginated
+# queries and storage transfers instead of re-doing the TLS handshake.
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60)
+HTTP_TIMEOUT = 120
+
 
 def get_client() -> Client:
-    """Create a Supabase client using service role key from environment."""
+    """Build a Supabase client on a pooled HTTP connection."""
     _load_env()
 
     url = os.environ.get("SUPABASE_URL", "")
@@ -24,7 +31,10 @@ def get_client() -> Client:
             "Set them in .env at the repo root or export them."
         )
 
-    return create_client(url, key)
+    http_client = httpx.Client(
+        limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT, follow_redirects=True, http2=True
+    )
+    return create_client(url, key, options=SyncClientOptions(httpx_client=http_client))
 
 
 def _load_env() -> None:
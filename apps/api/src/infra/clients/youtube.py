@@ -2,63 +2,100 @@
 
 from __future__ import annotations
 
+import json
 import re
 import subprocess
+import tempfile
 from pathlib import Path
+from typing import Any
 
 from domain.ports.downloader import AudioDownloader
 
+_UNSAFE_CHARS = re.compile(r"[^\w\s-]")
+_WHITESPACE = re.compile(r"\s+")
+
 
 class YouTubeDownloader(AudioDownloader):
     def download(self, url: str, dest_dir: Path, label: str) -> Path:
         dest_dir.mkdir(parents=True, exist_ok=True)
 
-        resolved_label = label or self._derive_label(url)
-        out_path = dest_dir / f"{resolved_label}.wav"
+        with tempfile.TemporaryDirectory() as tmp:
+            source_args = [url]
+            resolved_label = label
+            if not resolved_label:
+                # Fetch metadata once and hand it to the download, so the title
+                # lookup does not cost a second extraction round-trip.
+                info = self._fetch_info(url)
+                resolved_label = self._sanitize(str(info.get("title", "")))
+                info_path = Path(tmp) / "info.json"
+                info_path.write_text(json.dumps(info))
+                source_args = ["--load-info-json", str(info_path)]
 
-        try:
-            subprocess.run(
+            out_path = dest_dir / f"{resolved_label}.wav"
+            self._stream_to_wav(url, source_args, out_path)
+
+        return out_path
+
+    @staticmethod
+    def _stream_to_wav(url: str, source_args: list[str], out_path: Path) -> None:
+        with tempfile.TemporaryFile() as ytdlp_stderr:
+            ytdlp = subprocess.Popen(
                 [
-                    "yt-dlp",
-                    "--extract-audio",
-                    "--audio-format", "wav",
-                    "--postprocessor-args", "ffmpeg:-ac 1 -ar 16000",
-                    "-o", str(out_path),
-                    url,
+                    "yt-dlp", "-f", "bestaudio/best", "-o", "-",
+                    "--quiet", "--no-warnings", *source_args,
                 ],
-                capture_output=True,
-                text=True,
-                check=True,
+                stdout=subprocess.PIPE,
+                stderr=ytdlp_stderr,
             )
-        except subprocess.CalledProcessError as exc:
-            raise RuntimeError(
-                f"Failed to download audio for {url}: {exc.stderr or exc.stdout or exc}"
-            ) from exc
+            try:
+                ffmpeg = subprocess.Popen(
+                    [
+                        "ffmpeg", "-y", "-loglevel", "error",
+                        "-i", "pipe:0",
+                        "-ac", "1", "-ar", "16000", "-f", "wav",
+                        str(out_path),
+                    ],
+                    stdin=ytdlp.stdout,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
+                # Only ffmpeg should hold the read end, so yt-dlp sees SIGPIPE if ffmpeg dies.
+                if ytdlp.stdout is not None:
+                    ytdlp.stdout.close()
+                _, ffmpeg_err = ffmpeg.communicate()
+            except BaseException:
+                ytdlp.kill()
+                if ytdlp.stdout is not None:
+                    ytdlp.stdout.close()
+                raise
+            finally:
+                ytdlp.wait()
 
-        return out_path
+            ytdlp_stderr.seek(0)
+            ytdlp_err = ytdlp_stderr.read().decode(errors="replace")
 
-    @staticmethod
-    def _derive_label(url: str) -> str:
-        title = YouTubeDownloader._get_title(url)
-        return YouTubeDownloader._sanitize(title)
+        if ytdlp.returncode != 0 or ffmpeg.returncode != 0:
+            out_path.unlink(missing_ok=True)
+            # A failed ffmpeg also breaks yt-dlp's pipe, so its error is the root cause.
+            detail = ffmpeg_err.decode(errors="replace") if ffmpeg.returncode != 0 else ytdlp_err
+            raise RuntimeError(f"Failed to download audio for {url}: {detail.strip()}")
 
     @staticmethod
-    def _get_title(url: str) -> str:
+    def _fetch_info(url: str) -> dict[str, Any]:
         try:
             result = subprocess.run(
-                ["yt-dlp", "--get-title", url],
+                ["yt-dlp", "-J", "--no-warnings", url],
                 capture_output=True,
                 text=True,
                 check=True,
             )
         except subprocess.CalledProcessError as exc:
             raise RuntimeError(
-                f"Failed to fetch title for {url}: {exc.stderr or exc.stdout or exc}"
+                f"Failed to fetch metadata for {url}: {exc.stderr or exc.stdout or exc}"
             ) from exc
-        return result.stdout.strip()
+        info: dict[str, Any] = json.loads(result.stdout)
+        return info
 
     @staticmethod
     def _sanitize(name: str) -> str:
-        name = re.sub(r"[^\w\s-]", "", name)
-        name = re.sub(r"[\s]+", "-", name.strip())
-        return name.lower()[:80]
+        return _WHITESPACE.sub("-", _UNSAFE_CHARS.sub("", name).strip()).lower()[:80]
@@ -16,6 +16,13 @@ def _load_env() -> None:
         load_dotenv(dotenv_path)
 
 
+def _page_size_from_env() -> int:
+    page_size = int(os.environ.get("API_PAGE_SIZE", "1000"))
+    if page_size < 1:
+        raise ValueError(f"API_PAGE_SIZE must be at least 1, got {page_size}")
+    return page_size
+
+
 @dataclass(frozen=True)
 class Settings:
     supabase_url: str
@@ -24,6 +31,7 @@ class Settings:
     input_dir: Path = Path("data/input")
     output_dir: Path = Path("data/output")
     whisper_model: str = "small"
+    page_size: int = 1000
     # Telemetry settings
     otel_endpoint: str | None = None
     otel_service_name: str = "ambara-api"
@@ -39,6 +47,7 @@ class Settings:
             input_dir=Path(os.environ.get("API_INPUT_DIR", "data/input")),
             output_dir=Path(os.environ.get("API_OUTPUT_DIR", "data/output")),
             whisper_model=os.environ.get("API_WHISPER_MODEL", "small"),
+            page_size=_page_size_from_env(),
             otel_endpoint=os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT"),
             otel_service_name=os.environ.get("OTEL_SERVICE_NAME", "ambara-api"),
             otel_console_export=os.environ.get("OTEL_CONSOLE_EXPORT", "true").lower() == "true",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from supabase import Client
@@ -10,22 +11,28 @@ from domain.entities.clip import ClipStatus
 from domain.ports.clip_repository import ClipRepository
 
 PAGE_SIZE = 1000
+# PostgREST's default max-rows; larger pages come back truncated to this.
+SERVER_MAX_ROWS = 1000
+UPSERT_BATCH_SIZE = 500
+UPSERT_WORKERS = 4
 
 
 class SupabaseClipRepository(ClipRepository):
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: Client, page_size: int = PAGE_SIZE) -> None:
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
         self._client = client
+        self._page_size = page_size
 
     def upsert_batch(self, run_id: str, rows: list[dict[str, Any]]) -> None:
         for row in rows:
             row["run_id"] = run_id
 
-        batch_size = 500
-        for i in range(0, len(rows), batch_size):
-            batch = rows[i : i + batch_size]
-            self._client.table("clips").upsert(
-                batch, on_conflict="run_id,file_name"
-            ).execute()
+        batches = [
+            rows[i : i + UPSERT_BATCH_SIZE] for i in range(0, len(rows), UPSERT_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=UPSERT_WORKERS) as executor:
+            list(executor.map(self._upsert, batches))
 
     def find_by_run(
         self, run_id: str, *, status: ClipStatus | None = None, columns: str = "*"
@@ -45,7 +52,7 @@ class SupabaseClipRepository(ClipRepository):
         for status in ClipStatus:
             result = (
                 self._client.table("clips")
-                .select("id", count="exact")
+                .select("id", count="exact", head=True)
                 .eq("run_id", run_id)
                 .eq("status", status.value)
                 .execute()
@@ -53,21 +60,38 @@ class SupabaseClipRepository(ClipRepository):
             counts[status] = result.count if result.count is not None else 0
         return counts
 
+    def _upsert(self, batch: list[dict[str, Any]]) -> None:
+        self._client.table("clips").upsert(batch, on_conflict="run_id,file_name").execute()
+
     def _paginate(
         self, columns: str, filters: dict[str, str]
     ) -> list[dict[str, Any]]:
+        selected = [c.strip() for c in columns.split(",")]
+        strip_id = "*" not in selected and "id" not in selected
+        if strip_id:
+            columns = f"{columns},id"
+
+        # A short page only means "done" when the server could have filled it.
+        short_page_ends = self._page_size <= SERVER_MAX_ROWS
         all_rows: list[dict[str, Any]] = []
-        offset = 0
+        last_id: str | None = None
 
         while True:
             query = self._client.table("clips").select(columns)
             for key, value in filters.items():
                 query = query.eq(key, value)
-            result = query.range(offset, offset + PAGE_SIZE - 1).execute()
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            result = query.order("id").limit(self._page_size).execute()
             batch = result.data or []
+            if not batch:
+                break
             all_rows.extend(batch)
-            if len(batch) < PAGE_SIZE:
+            if short_page_ends and len(batch) < self._page_size:
                 break
-            offset += PAGE_SIZE
+            last_id = batch[-1]["id"]
 
+        if strip_id:
+            for row in all_rows:
+                del row["id"]
         return all_rows
@@ -4,16 +4,16 @@ from __future__ import annotations
 
 import logging
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import NoReturn
 
-import torch
 import typer
 from pydantic import ValidationError
 
 from application.types import ExportRequest, IngestRequest, RedraftRequest, TrainRequest
 from domain.exceptions import MissingConfigError, RunNotFoundError, SyncError
-from infra.telemetry.logging import configure_cli_logging
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +126,8 @@ def main_callback(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
 ) -> None:
     """Configure CLI before running commands."""
+    from infra.telemetry.logging import configure_cli_logging
+
     configure_cli_logging(verbose=verbose)
 
 
@@ -155,6 +157,7 @@ def ingest(
     from infra.clients.ml.model_cache import get_models
     from infra.clients.supabase import get_client
     from infra.clients.youtube import YouTubeDownloader
+    from infra.config import Settings
     from infra.repositories.supabase_clip_repo import SupabaseClipRepository
     from infra.repositories.supabase_run_repo import SupabaseRunRepository
     from infra.repositories.supabase_storage import SupabaseAudioStorage
@@ -162,20 +165,23 @@ def ingest(
     resolved_device = detect_device(device)
 
     is_url = request.url.startswith("http://") or request.url.startswith("https://")
-    if is_url:
-        downloader = YouTubeDownloader()
-        audio_path = downloader.download(request.url, Path("data/input"), request.label)
-    else:
-        audio_path = Path(request.url)
-        if not audio_path.exists():
-            raise typer.BadParameter(f"Input file not found: {audio_path}")
-
-    models = get_models(
-        resolved_device,
-        vad_threshold=request.vad_threshold,
-        whisper_model=request.whisper_model,
-        whisper_hf=request.whisper_hf or "",
-    )
+    audio_path = Path(request.url)
+    if not is_url and not audio_path.exists():
+        raise typer.BadParameter(f"Input file not found: {audio_path}")
+
+    # Model loading is independent of the download, so overlap the two.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        models_future = executor.submit(
+            get_models,
+            resolved_device,
+            vad_threshold=request.vad_threshold,
+            whisper_model=request.whisper_model,
+            whisper_hf=request.whisper_hf or "",
+        )
+        if is_url:
+            downloader = YouTubeDownloader()
+            audio_path = downloader.download(request.url, Path("data/input"), request.label)
+        models = models_future.result()
 
     run_dir = run_pipeline(
         str(audio_path),
@@ -193,7 +199,7 @@ def ingest(
     client = get_client()
     sync = SyncRun(
         SupabaseRunRepository(client),
-        SupabaseClipRepository(client),
+        SupabaseClipRepository(client, page_size=Settings.from_env().page_size),
         SupabaseAudioStorage(client),
     )
     sync.execute(run_dir, request.label or run_dir.name)
@@ -208,6 +214,7 @@ def sync(
     """Upload clips and metadata from a local extraction run to database."""
     from application.use_cases.sync_run import SyncRun
     from infra.clients.supabase import get_client
+    from infra.config import Settings
     from infra.repositories.supabase_clip_repo import SupabaseClipRepository
     from infra.repositories.supabase_run_repo import SupabaseRunRepository
     from infra.repositories.supabase_storage import SupabaseAudioStorage
@@ -219,7 +226,7 @@ def sync(
     client = get_client()
     use_case = SyncRun(
         SupabaseRunRepository(client),
-        SupabaseClipRepository(client),
+        SupabaseClipRepository(client, page_size=Settings.from_env().page_size),
         SupabaseAudioStorage(client),
     )
     use_case.execute(resolved_dir, label or resolved_dir.name)
@@ -236,6 +243,7 @@ def export_cmd(
 
     from application.use_cases.export_training import ExportTraining
     from infra.clients.supabase import get_client
+    from infra.config import Settings
     from infra.repositories.supabase_clip_repo import SupabaseClipRepository
     from infra.repositories.supabase_run_repo import SupabaseRunRepository
     from infra.repositories.supabase_storage import SupabaseAudioStorage
@@ -243,7 +251,7 @@ def export_cmd(
     client = get_client()
     use_case = ExportTraining(
         SupabaseRunRepository(client),
-        SupabaseClipRepository(client),
+        SupabaseClipRepository(client, page_size=Settings.from_env().page_size),
         SupabaseAudioStorage(client),
     )
     dataset_dir = use_case.execute(
@@ -270,38 +278,44 @@ def redraft(
     )
 
     from application.services.audio_processing import detect_device
-    from application.services.training import get_transcriptions
+    from application.services.training import get_transcriptions, load_whisper
     from domain.entities.clip import ClipStatus
     from infra.clients.supabase import get_client
+    from infra.config import Settings
     from infra.repositories.supabase_clip_repo import SupabaseClipRepository
     from infra.repositories.supabase_run_repo import SupabaseRunRepository
 
     resolved_device = detect_device(request.device)
     client = get_client()
     run_repo = SupabaseRunRepository(client)
-    clip_repo = SupabaseClipRepository(client)
+    clip_repo = SupabaseClipRepository(client, page_size=Settings.from_env().page_size)
 
     total_updated = 0
+    whisper = None
     for run_id in request.run_ids:
-        label = run_repo.resolve_label(run_id)
+        run = run_repo.find_by_id(run_id)
+        if run is None:
+            raise RunNotFoundError(f"No run found with id '{run_id}'")
         pending = clip_repo.find_by_run(run_id, status=ClipStatus.PENDING, columns="id,file_name")
         if not pending:
-            typer.echo(f"No pending clips for {label}")
+            typer.echo(f"No pending clips for {run.label}")
             continue
 
-        run = run_repo.find_by_id(run_id)
-        source_dir = Path("data/output") / label
-        if run and run.source:
+        source_dir = Path("data/output") / run.label
+        if run.source:
             stored = Path(run.source)
-            if stored.exists() and (stored / "clips").is_dir():
+            if (stored / "clips").is_dir():
                 source_dir = stored
 
+        if whisper is None:
+            whisper = load_whisper(request.model_path, resolved_device)
         transcriptions = get_transcriptions(
             request.model_path,
             source_dir,
             pending,
             resolved_device,
             request.language,
+            whisper=whisper,
         )
         for clip_id, text in transcriptions:
             clip_repo.update_transcription(clip_id, text)
@@ -415,20 +429,26 @@ def purge_api_cache() -> None:
     )
 
 
+def _is_cuda_oom(error: BaseException) -> bool:
+    """Check for a CUDA OOM without importing torch when no command loaded it."""
+    torch = sys.modules.get("torch")
+    return torch is not None and isinstance(error, torch.cuda.OutOfMemoryError)
+
+
 def main() -> None:
     try:
         app()
-    except torch.cuda.OutOfMemoryError as e:
-        logger.error("CUDA out of memory: %s", e)
-        logger.error(
-            "Suggestion: Reduce --batch-size to 1 or 2, especially for whisper-medium/large"
-        )
-        raise typer.Exit(1) from e
     except (RunNotFoundError, MissingConfigError, SyncError) as e:
         logger.error("Error: %s", e)
         raise typer.Exit(1) from e
     except Exception as e:
-        logger.exception("Unexpected error: %s", e)
+        if _is_cuda_oom(e):
+            logger.error("CUDA out of memory: %s", e)
+            logger.error(
+                "Suggestion: Reduce --batch-size to 1 or 2, especially for whisper-medium/large"
+            )
+        else:
+            logger.exception("Unexpected error: %s", e)
         raise typer.Exit(1) from e
 
 
@@ -41,7 +41,7 @@ def create_app() -> FastAPI:
     client = get_client()
 
     run_repo = SupabaseRunRepository(client)
-    clip_repo = SupabaseClipRepository(client)
+    clip_repo = SupabaseClipRepository(client, page_size=settings.page_size)
     job_repo = SupabaseJobRepository(client)
     storage = SupabaseAudioStorage(client)
 
@@ -2,32 +2,53 @@
 
 from __future__ import annotations
 
+import io
+import subprocess
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pandas as pd
 import pytest
+import soundfile as sf
 
-from application.services.audio_processing import format_duration
-from application.services.clip_extraction import group_segments
+from application.services.audio_processing import (
+    format_duration,
+    load_audio_segment,
+    prefetch,
+    probe_duration,
+    stream_chunks,
+)
+from application.services.clip_download import download_missing
+from application.services.clip_extraction import _Pcm16Writer, group_segments, run_pipeline
 from domain.entities.clip import AudioSegment
 
 
+@lru_cache(maxsize=32)
+def _make_audio(duration_sec: float, sample_rate: int = 16000) -> np.ndarray:
+    """Shared silent test audio, read-only so tests cannot leak writes into each other."""
+    audio = np.zeros(int(duration_sec * sample_rate), dtype=np.float32)
+    audio.setflags(write=False)
+    return audio
+
+
 class TestGroupSegments:
     def test_empty_segments(self) -> None:
-        result = group_segments([], np.zeros(16000), 16000, Path("test.wav"))
+        result = group_segments([], _make_audio(1), 16000, Path("test.wav"))
         assert result == []
 
     def test_single_long_segment(self) -> None:
         segments = [AudioSegment(start_sec=0.0, end_sec=10.0)]
-        audio = np.zeros(16000 * 10, dtype=np.float32)
+        audio = _make_audio(10)
         result = group_segments(segments, audio, 16000, Path("test.wav"))
         assert len(result) == 1
         assert result[0].duration == pytest.approx(10.0)
 
     def test_short_segment_rejected(self) -> None:
         segments = [AudioSegment(start_sec=0.0, end_sec=2.0)]
-        audio = np.zeros(16000 * 2, dtype=np.float32)
+        audio = _make_audio(2)
         result = group_segments(segments, audio, 16000, Path("test.wav"), min_duration=5.0)
         assert len(result) == 0
 
@@ -36,7 +57,7 @@ class TestGroupSegments:
             AudioSegment(start_sec=0.0, end_sec=3.0),
             AudioSegment(start_sec=3.5, end_sec=7.0),
         ]
-        audio = np.zeros(16000 * 7, dtype=np.float32)
+        audio = _make_audio(7)
         result = group_segments(segments, audio, 16000, Path("test.wav"), max_gap=1.5)
         assert len(result) == 1
         assert result[0].start_sec == 0.0
@@ -47,18 +68,207 @@ class TestGroupSegments:
             AudioSegment(start_sec=0.0, end_sec=6.0),
             AudioSegment(start_sec=10.0, end_sec=16.0),
         ]
-        audio = np.zeros(16000 * 16, dtype=np.float32)
+        audio = _make_audio(16)
         result = group_segments(segments, audio, 16000, Path("test.wav"), max_gap=1.5)
         assert len(result) == 2
 
+    def test_group_split_at_max_duration(self) -> None:
+        segments = [
+            AudioSegment(start_sec=float(start), end_sec=start + 9.5) for start in (0, 10, 20, 30)
+        ]
+        audio = _make_audio(40)
+        result = group_segments(segments, audio, 16000, Path("test.wav"), max_duration=30.0)
+        assert [(c.start_sec, c.end_sec) for c in result] == [(0.0, 29.5), (30.0, 39.5)]
+
     def test_audio_start_offset(self) -> None:
         segments = [AudioSegment(start_sec=100.0, end_sec=110.0)]
-        audio = np.zeros(16000 * 10, dtype=np.float32)
+        audio = _make_audio(10)
         result = group_segments(segments, audio, 16000, Path("test.wav"), audio_start_sec=100.0)
         assert len(result) == 1
         assert len(result[0].audio) > 0
 
 
+class TestRunPipeline:
+    @staticmethod
+    def _run(tmp_path: Path, scores: list[tuple[float, float]]) -> Path | None:
+        sample_rate = 16000
+        audio = np.zeros(sample_rate * 40, dtype=np.float32)
+        vad = MagicMock()
+        vad.detect.return_value = [
+            AudioSegment(start_sec=0.0, end_sec=10.0),
+            AudioSegment(start_sec=20.0, end_sec=30.0),
+        ]
+        classifier = MagicMock()
+        classifier.classify.side_effect = scores
+        transcriber = MagicMock()
+        transcriber.transcribe.return_value = {
+            "text": "salama",
+            "avg_logprob": -0.2,
+            "no_speech_prob": 0.1,
+        }
+
+        with patch(
+            "application.services.clip_extraction.stream_chunks",
+            return_value=iter([(0.0, audio)]),
+        ):
+            return run_pipeline(
+                "source.wav",
+                str(tmp_path),
+                vad,
+                classifier,
+                transcriber,
+                run_label="test",
+            )
+
+    def test_writes_accepted_clips_and_metadata(self, tmp_path: Path) -> None:
+        run_dir = self._run(tmp_path, [(0.9, 0.1), (0.2, 0.9)])
+
+        assert run_dir is not None
+        assert sorted(p.name for p in (run_dir / "clips").iterdir()) == ["clip_00001.wav"]
+        metadata = pd.read_csv(run_dir / "metadata.csv")
+        assert metadata["file_name"].tolist() == ["clips/clip_00001.wav"]
+        assert metadata["start_sec"].tolist() == [0.0]
+        assert metadata["speech_score"].tolist() == [0.9]
+        assert metadata["transcription"].tolist() == ["salama"]
+
+    def test_returns_none_when_nothing_accepted(self, tmp_path: Path) -> None:
+        assert self._run(tmp_path, [(0.1, 0.1), (0.5, 0.9)]) is None
+
+
+class TestPcm16Writer:
+    def test_matches_soundfile_conversion(self, tmp_path: Path) -> None:
+        audio = np.array([0.0, 0.5, -0.5, 1.0, -1.0, 1.5, -1.5, 0.25], dtype=np.float32)
+        sf.write(str(tmp_path / "expected.wav"), audio, 16000, subtype="PCM_16")
+
+        _Pcm16Writer(4).write(tmp_path / "actual.wav", audio, 16000)
+
+        expected, _ = sf.read(tmp_path / "expected.wav", dtype="int16")
+        actual, _ = sf.read(tmp_path / "actual.wav", dtype="int16")
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_matches_soundfile_on_random_audio(self, tmp_path: Path) -> None:
+        audio = np.random.default_rng(0).uniform(-1.2, 1.2, 48000).astype(np.float32)
+        sf.write(str(tmp_path / "expected.wav"), audio, 16000, subtype="PCM_16")
+
+        _Pcm16Writer(4).write(tmp_path / "actual.wav", audio, 16000)
+
+        expected, _ = sf.read(tmp_path / "expected.wav", dtype="int16")
+        actual, _ = sf.read(tmp_path / "actual.wav", dtype="int16")
+        np.testing.assert_array_equal(actual, expected)
+
+
+class TestDownloadMissing:
+    def test_skips_clips_already_on_disk(self, tmp_path: Path) -> None:
+        (tmp_path / "a.wav").write_bytes(b"")
+        storage = MagicMock()
+
+        download_missing(storage, "run-1", tmp_path, ["a.wav", "b.wav"])
+
+        storage.download.assert_called_once_with("run-1", "b.wav", tmp_path / "b.wav")
+
+
+class TestProbeDuration:
+    def test_reads_pcm_wav_header(self, tmp_path: Path) -> None:
+        path = tmp_path / "clip.wav"
+        sf.write(str(path), np.zeros(16000 * 3, dtype=np.float32), 16000, subtype="PCM_16")
+
+        with patch("application.services.audio_processing.subprocess.run") as run:
+            assert probe_duration(str(path)) == pytest.approx(3.0)
+        run.assert_not_called()
+
+    def test_falls_back_to_ffprobe_for_other_formats(self, tmp_path: Path) -> None:
+        path = tmp_path / "talk.mp3"
+        path.write_bytes(b"ID3not-a-wav")
+
+        with patch("application.services.audio_processing.subprocess.run") as run:
+            run.return_value.stdout = "12.5\n"
+            assert probe_duration(str(path)) == 12.5
+        assert run.call_args.args[0][0] == "ffprobe"
+
+
+def _fake_ffmpeg(stdout: bytes, returncode: int = 0) -> MagicMock:
+    proc = MagicMock()
+    proc.__enter__.return_value = proc
+    proc.stdout = io.BytesIO(stdout)
+    proc.returncode = returncode
+    return proc
+
+
+class TestLoadAudioSegment:
+    def test_reads_decoded_samples(self) -> None:
+        samples = np.linspace(-1, 1, 1600, dtype=np.float32)
+
+        with patch(
+            "application.services.audio_processing.subprocess.Popen",
+            return_value=_fake_ffmpeg(samples.tobytes()),
+        ) as popen:
+            audio = load_audio_segment("talk.mp3", 1.0, 0.1, 16000)
+
+        np.testing.assert_array_equal(audio, samples)
+        assert popen.call_args.args[0][0] == "ffmpeg"
+
+    def test_grows_when_decoder_returns_more_than_expected(self) -> None:
+        samples = np.arange(5000, dtype=np.float32)
+
+        with patch(
+            "application.services.audio_processing.subprocess.Popen",
+            return_value=_fake_ffmpeg(samples.tobytes()),
+        ):
+            audio = load_audio_segment("talk.mp3", 0.0, 0.1, 16000)
+
+        np.testing.assert_array_equal(audio, samples)
+
+    def test_passes_decoder_threads_before_input(self) -> None:
+        with patch(
+            "application.services.audio_processing.subprocess.Popen",
+            return_value=_fake_ffmpeg(b""),
+        ) as popen:
+            load_audio_segment("talk.mp3", 0.0, 1.0, threads=1)
+
+        cmd = popen.call_args.args[0]
+        assert cmd[cmd.index("-loglevel") + 1] == "error"
+        assert cmd[cmd.index("-threads") + 1] == "1"
+        assert cmd.index("-threads") < cmd.index("-i")
+
+    def test_raises_on_decoder_failure(self) -> None:
+        with (
+            patch(
+                "application.services.audio_processing.subprocess.Popen",
+                return_value=_fake_ffmpeg(b"", returncode=1),
+            ),
+            pytest.raises(subprocess.CalledProcessError),
+        ):
+            load_audio_segment("missing.mp3", 0.0, 1.0)
+
+
+class TestStreamChunks:
+    def test_decodes_once_and_reuses_overlap(self) -> None:
+        samples = np.arange(25, dtype=np.float32)
+
+        with patch(
+            "application.services.audio_processing.subprocess.Popen",
+            return_value=_fake_ffmpeg(samples.tobytes()),
+        ) as popen:
+            chunks = list(stream_chunks("talk.mp3", 10, overlap_sec=2, sample_rate=1))
+
+        popen.assert_called_once()
+        assert [start for start, _ in chunks] == [0.0, 8.0, 18.0]
+        np.testing.assert_array_equal(chunks[0][1], samples[0:10])
+        np.testing.assert_array_equal(chunks[1][1], samples[8:20])
+        np.testing.assert_array_equal(chunks[2][1], samples[18:25])
+
+    def test_exact_multiple_has_no_empty_tail_chunk(self) -> None:
+        samples = np.zeros(20, dtype=np.float32)
+
+        with patch(
+            "application.services.audio_processing.subprocess.Popen",
+            return_value=_fake_ffmpeg(samples.tobytes()),
+        ):
+            chunks = list(stream_chunks("talk.mp3", 10, overlap_sec=2, sample_rate=1))
+
+        assert [len(audio) for _, audio in chunks] == [10, 12]
+
+
 class TestFormatDuration:
     def test_seconds_only(self) -> None:
         assert format_duration(45) == "45s"
@@ -75,8 +285,42 @@ class TestFormatDuration:
     def test_zero(self) -> None:
         assert format_duration(0) == "0s"
 
+    def test_hours_skip_zero_parts(self) -> None:
+        assert format_duration(3600) == "1h"
+        assert format_duration(3605) == "1h 5s"
+        assert format_duration(7320) == "2h 2m"
+
+
+class TestPrefetch:
+    def test_preserves_order(self) -> None:
+        assert list(prefetch(iter(range(10)), size=2)) == list(range(10))
+
+    def test_reraises_producer_error(self) -> None:
+        def failing() -> Iterator[int]:
+            yield 1
+            raise RuntimeError("decode failed")
+
+        result: list[int] = []
+        with pytest.raises(RuntimeError, match="decode failed"):
+            for item in prefetch(failing()):
+                result.append(item)
+        assert result == [1]
+
+    def test_consumer_can_stop_early(self) -> None:
+        items = prefetch(iter(range(100)), size=1)
+        assert next(items) == 0
+        items.close()
+
 
 class TestDetectDevice:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> Iterator[None]:
+        from application.services.audio_processing import _detect_auto
+
+        _detect_auto.cache_clear()
+        yield
+        _detect_auto.cache_clear()
+
     def test_explicit_device(self) -> None:
         from application.services.audio_processing import detect_device
 
@@ -93,6 +337,23 @@ class TestDetectDevice:
         ):
             assert detect_device("auto") == "cpu"
 
+    def test_auto_without_torch_is_cpu(self) -> None:
+        from application.services.audio_processing import detect_device
+
+        with patch("application.services.audio_processing.find_spec", return_value=None):
+            assert detect_device("auto") == "cpu"
+
+    def test_auto_probes_once(self) -> None:
+        from application.services.audio_processing import detect_device
+
+        with (
+            patch("torch.cuda.is_available", return_value=True) as cuda_available,
+            patch("torch.backends.mps.is_available", return_value=False),
+        ):
+            assert detect_device("auto") == "cuda"
+            assert detect_device("auto") == "cuda"
+        cuda_available.assert_called_once()
+
 
 class TestRichProgressCallback:
     def test_callback_creates_progress_bar(self) -> None:
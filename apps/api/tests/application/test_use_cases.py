@@ -4,13 +4,13 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 
 from domain.entities.run import Run, RunType
-from domain.exceptions import SyncError
+from domain.exceptions import RunNotFoundError, SyncError
 
 
 def _make_run(
@@ -57,7 +57,7 @@ class TestSyncRun:
             "duration_sec": 5.0,
             "speech_score": 0.9,
             "music_score": 0.1,
-            "transcription": "hello",
+            "transcription": None,
         }])
         df.to_csv(run_dir / "metadata.csv", index=False)
 
@@ -72,7 +72,16 @@ class TestSyncRun:
         assert result == "new-run-id"
         run_repo.create.assert_called_once()
         storage.upload.assert_called_once()
-        clip_repo.upsert_batch.assert_called_once()
+        clip_repo.upsert_batch.assert_called_once_with("new-run-id", [{
+            "file_name": "clips/clip_00001.wav",
+            "source_file": "source.wav",
+            "start_sec": 0.0,
+            "end_sec": 5.0,
+            "duration_sec": 5.0,
+            "speech_score": 0.9,
+            "music_score": 0.1,
+            "draft_transcription": None,
+        }])
 
     def test_sync_raises_on_missing_metadata(self, tmp_path: Path) -> None:
         from application.use_cases.sync_run import SyncRun
@@ -99,7 +108,6 @@ class TestExportTraining:
         output_dir.mkdir()
 
         run_repo = MagicMock()
-        run_repo.resolve_label.return_value = "test"
         run_repo.find_by_id.return_value = _make_run(source=str(source_dir))
 
         clip_repo = MagicMock()
@@ -116,7 +124,10 @@ class TestExportTraining:
 
         assert result.exists()
         assert (result / "train").is_dir()
-        assert (result / "train" / "metadata.csv").exists()
+        metadata = pd.read_csv(result / "train" / "metadata.csv")
+        assert metadata.to_dict("records") == [
+            {"file_name": "clip_00001.wav", "transcription": "hello world"}
+        ]
 
     def test_export_overwrites_existing(self, tmp_path: Path) -> None:
         from application.use_cases.export_training import ExportTraining
@@ -130,7 +141,6 @@ class TestExportTraining:
         output_dir.mkdir()
 
         run_repo = MagicMock()
-        run_repo.resolve_label.return_value = "test"
         run_repo.find_by_id.return_value = _make_run(source=str(source_dir))
 
         clip_repo = MagicMock()
@@ -150,11 +160,92 @@ class TestExportTraining:
         result2 = use_case.execute(["run-1"], output_dir, eval_split=0.0)
         assert not (result2 / "marker.txt").exists()
 
+    def test_export_copies_when_hardlink_fails(self, tmp_path: Path) -> None:
+        from application.use_cases.export_training import ExportTraining
+
+        source_dir = tmp_path / "source"
+        clips_dir = source_dir / "clips"
+        clips_dir.mkdir(parents=True)
+        (clips_dir / "clip_00001.wav").write_bytes(b"fake-wav")
+
+        run_repo = MagicMock()
+        run_repo.find_by_id.return_value = _make_run(source=str(source_dir))
+
+        clip_repo = MagicMock()
+        clip_repo.find_by_run.return_value = [
+            {
+                "file_name": "clips/clip_00001.wav",
+                "corrected_transcription": "hello",
+            }
+        ]
+
+        use_case = ExportTraining(run_repo, clip_repo, MagicMock())
+        with patch(
+            "application.use_cases.export_training.os.link",
+            side_effect=OSError("cross-device link"),
+        ):
+            result = use_case.execute(["run-1"], tmp_path / "output", eval_split=0.0)
+
+        assert (result / "train" / "clip_00001.wav").read_bytes() == b"fake-wav"
+
+    def test_export_raises_on_missing_clip_files(self, tmp_path: Path) -> None:
+        from application.use_cases.export_training import ExportTraining
+
+        source_dir = tmp_path / "source"
+        clips_dir = source_dir / "clips"
+        clips_dir.mkdir(parents=True)
+        (clips_dir / "clip_00001.wav").write_bytes(b"fake-wav")
+
+        run_repo = MagicMock()
+        run_repo.find_by_id.return_value = _make_run(source=str(source_dir))
+
+        clip_repo = MagicMock()
+        clip_repo.find_by_run.return_value = [
+            {"file_name": "clips/clip_00001.wav", "corrected_transcription": "a"},
+            {"file_name": "clips/clip_00002.wav", "corrected_transcription": "b"},
+        ]
+
+        use_case = ExportTraining(run_repo, clip_repo, MagicMock())
+        with pytest.raises(SyncError, match="1 clip files not found.*clip_00002"):
+            use_case.execute(["run-1"], tmp_path / "output")
+
+    def test_export_downloads_only_missing_clips(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from application.use_cases.export_training import ExportTraining
+
+        monkeypatch.chdir(tmp_path)
+        dest_dir = Path("data/output/test/clips")
+        dest_dir.mkdir(parents=True)
+        (dest_dir / "clip_00001.wav").write_bytes(b"fake-wav")
+
+        clip_repo = MagicMock()
+        clip_repo.find_by_run.return_value = [
+            {"file_name": f"clips/clip_{i:05d}.wav"} for i in range(1, 4)
+        ]
+        storage = MagicMock()
+
+        use_case = ExportTraining(MagicMock(), clip_repo, storage)
+        source_dir = use_case._ensure_source_dir(_make_run(source=None))
+
+        assert source_dir == Path("data/output/test")
+        downloaded = sorted(call.args[1] for call in storage.download.call_args_list)
+        assert downloaded == ["clips/clip_00002.wav", "clips/clip_00003.wav"]
+
+    def test_export_raises_on_unknown_run(self) -> None:
+        from application.use_cases.export_training import ExportTraining
+
+        run_repo = MagicMock()
+        run_repo.find_by_id.return_value = None
+
+        use_case = ExportTraining(run_repo, MagicMock(), MagicMock())
+        with pytest.raises(RunNotFoundError, match="missing"):
+            use_case.execute(["missing"], Path("out"))
+
     def test_export_raises_on_no_clips(self) -> None:
         from application.use_cases.export_training import ExportTraining
 
         run_repo = MagicMock()
-        run_repo.resolve_label.return_value = "test"
         run_repo.find_by_id.return_value = _make_run()
 
         clip_repo = MagicMock()
@@ -167,6 +258,33 @@ class TestExportTraining:
             use_case.execute(["run-1"], Path("out"))
 
 
+class TestRedraftClips:
+    def test_loads_model_once_for_all_runs(self, tmp_path: Path) -> None:
+        from application.use_cases.redraft_clips import RedraftClips
+
+        (tmp_path / "clips").mkdir()
+        run_repo = MagicMock()
+        run_repo.find_by_id.return_value = _make_run(source=str(tmp_path))
+        clip_repo = MagicMock()
+        clip_repo.find_by_run.return_value = [{"id": "c1", "file_name": "clips/a.wav"}]
+        job_repo = MagicMock()
+
+        use_case = RedraftClips(run_repo, clip_repo, MagicMock(), job_repo)
+        with (
+            patch("application.use_cases.redraft_clips.load_whisper") as load,
+            patch(
+                "application.use_cases.redraft_clips.get_transcriptions",
+                return_value=[("c1", "salama")],
+            ) as transcribe,
+        ):
+            use_case.execute("job-1", ["run-1", "run-2"], "model-dir", "cpu")
+
+        load.assert_called_once_with("model-dir", "cpu")
+        assert transcribe.call_count == 2
+        assert all(c.kwargs["whisper"] is load.return_value for c in transcribe.call_args_list)
+        job_repo.fail.assert_not_called()
+
+
 class TestDeleteRun:
     def test_deletes_storage_and_run(self) -> None:
         from application.use_cases.manage_runs import DeleteRun
@@ -181,6 +299,21 @@ class TestDeleteRun:
         run_repo.delete.assert_called_once_with("run-1")
 
 
+class TestCleanup:
+    def test_removes_all_prefixes_then_deletes_empty_runs(self) -> None:
+        from application.use_cases.manage_runs import Cleanup
+
+        run_repo = MagicMock()
+        storage = MagicMock()
+
+        use_case = Cleanup(run_repo, MagicMock(), storage)
+        use_case.execute(["run-1", "run-2"], ["orphan"])
+
+        removed = sorted(call.args[0] for call in storage.remove_prefix.call_args_list)
+        assert removed == ["orphan", "run-1", "run-2"]
+        assert [call.args[0] for call in run_repo.delete.call_args_list] == ["run-1", "run-2"]
+
+
 class TestIngestRun:
     def test_ingest_updates_job_on_failure(self) -> None:
         from application.use_cases.ingest_run import IngestRun
@@ -202,3 +335,29 @@ class TestIngestRun:
 
         job_repo.fail.assert_called_once()
         assert "download failed" in job_repo.fail.call_args[0][1]
+
+    def test_ingest_logs_stage_timings(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        from application.use_cases.ingest_run import IngestRun
+
+        downloader = MagicMock()
+        downloader.download.return_value = tmp_path / "audio.wav"
+        sync = MagicMock()
+        sync.execute.return_value = "run-1"
+        job_repo = MagicMock()
+
+        use_case = IngestRun(downloader, MagicMock(), MagicMock(), MagicMock(), sync, job_repo)
+        with (
+            patch("application.use_cases.ingest_run.run_pipeline", return_value=tmp_path),
+            caplog.at_level("INFO", logger="application.use_cases.ingest_run"),
+        ):
+            use_case.execute(
+                "job-1", "http://example.com", "label",
+                input_dir=tmp_path, output_dir=tmp_path,
+            )
+
+        assert job_repo.update.call_args.kwargs["status"] == "done"
+        assert "download=" in caplog.text
+        assert "extract=" in caplog.text
+        assert "sync=" in caplog.text
@@ -106,6 +106,10 @@ class TestAudioSegment:
         with pytest.raises(AttributeError):
             seg.start_sec = 5.0  # type: ignore[misc]
 
+    def test_has_no_instance_dict(self) -> None:
+        seg = AudioSegment(start_sec=0.0, end_sec=1.0)
+        assert not hasattr(seg, "__dict__")
+
 
 class TestClipCandidate:
     def test_properties(self) -> None:
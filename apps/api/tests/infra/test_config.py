@@ -5,6 +5,8 @@ from __future__ import annotations
 import os
 from unittest.mock import patch
 
+import pytest
+
 from infra.config import Settings
 
 
@@ -37,3 +39,15 @@ class TestSettings:
 
             assert settings.otel_endpoint is None
             assert settings.otel_service_name == "ambara-api"
+            assert settings.page_size == 1000
+
+    def test_page_size_from_env(self) -> None:
+        with patch.dict(os.environ, {"API_PAGE_SIZE": "5000"}):
+            assert Settings.from_env().page_size == 5000
+
+    def test_rejects_non_positive_page_size(self) -> None:
+        with (
+            patch.dict(os.environ, {"API_PAGE_SIZE": "0"}),
+            pytest.raises(ValueError, match="API_PAGE_SIZE"),
+        ):
+            Settings.from_env()
@@ -29,6 +29,9 @@ class _FakeQuery:
     def neq(self, *_: object, **__: object) -> _FakeQuery:
         return self
 
+    def gt(self, *_: object) -> _FakeQuery:
+        return self
+
     def order(self, *_: object, **__: object) -> _FakeQuery:
         return self
 
@@ -146,6 +149,65 @@ class TestSupabaseClipRepository:
         repo.upsert_batch("run-1", rows)
         assert rows[0]["run_id"] == "run-1"
 
+    def test_upsert_batch_splits_into_batches(self) -> None:
+        from infra.repositories.supabase_clip_repo import SupabaseClipRepository
+
+        client = MagicMock()
+        repo = SupabaseClipRepository(client)
+        rows = [{"file_name": f"clip_{i:05d}.wav"} for i in range(1200)]
+        repo.upsert_batch("run-1", rows)
+
+        upsert = client.table.return_value.upsert
+        sizes = sorted(len(call.args[0]) for call in upsert.call_args_list)
+        assert sizes == [200, 500, 500]
+
+    def test_find_by_run_pages_by_id(self) -> None:
+        from infra.repositories.supabase_clip_repo import SupabaseClipRepository
+
+        client = MagicMock()
+        query = MagicMock()
+        for method in ("select", "eq", "gt", "order", "limit"):
+            getattr(query, method).return_value = query
+        query.execute.side_effect = [
+            _FakeResponse([{"id": "a", "file_name": "1.wav"}, {"id": "b", "file_name": "2.wav"}]),
+            _FakeResponse([{"id": "c", "file_name": "3.wav"}]),
+        ]
+        client.table.return_value = query
+
+        repo = SupabaseClipRepository(client, page_size=2)
+        rows = repo.find_by_run("run-1", columns="file_name")
+
+        assert rows == [{"file_name": "1.wav"}, {"file_name": "2.wav"}, {"file_name": "3.wav"}]
+        query.select.assert_called_with("file_name,id")
+        assert [c.args for c in query.gt.call_args_list] == [("id", "b")]
+        assert query.execute.call_count == 2
+
+    def test_find_by_run_keeps_paging_when_server_caps_rows(self) -> None:
+        from infra.repositories.supabase_clip_repo import SupabaseClipRepository
+
+        client = MagicMock()
+        query = MagicMock()
+        for method in ("select", "eq", "gt", "order", "limit"):
+            getattr(query, method).return_value = query
+        query.execute.side_effect = [
+            _FakeResponse([{"id": "a"}, {"id": "b"}]),
+            _FakeResponse([{"id": "c"}]),
+            _FakeResponse([]),
+        ]
+        client.table.return_value = query
+
+        repo = SupabaseClipRepository(client, page_size=5000)
+        rows = repo.find_by_run("run-1", columns="id")
+
+        assert [row["id"] for row in rows] == ["a", "b", "c"]
+        assert query.execute.call_count == 3
+
+    def test_rejects_non_positive_page_size(self) -> None:
+        from infra.repositories.supabase_clip_repo import SupabaseClipRepository
+
+        with pytest.raises(ValueError, match="page_size"):
+            SupabaseClipRepository(MagicMock(), page_size=0)
+
     def test_count_by_status(self) -> None:
         from infra.repositories.supabase_clip_repo import SupabaseClipRepository
 
@@ -159,6 +221,7 @@ class TestSupabaseClipRepository:
         repo = SupabaseClipRepository(client)
         counts = repo.count_by_status("run-1")
         assert all(c == 5 for c in counts.values())
+        query.select.assert_called_with("id", count="exact", head=True)
 
 
 class TestSupabaseJobRepository:
@@ -204,3 +267,25 @@ class TestSupabaseJobRepository:
         client = _make_client()
         repo = SupabaseJobRepository(client)
         repo.fail("j1", "something broke")
+
+
+class TestSupabaseAudioStorage:
+    def test_remove_prefix_includes_sub_folder_files(self) -> None:
+        from infra.repositories.supabase_storage import SupabaseAudioStorage
+
+        listings = {
+            "run-1": [{"name": "clips", "id": None}, {"name": "metadata.csv", "id": "f1"}],
+            "run-1/clips": [{"name": "a.wav", "id": "f2"}, {"name": "b.wav", "id": "f3"}],
+        }
+        client = MagicMock()
+        bucket = client.storage.from_.return_value
+        bucket.list.side_effect = lambda path: listings.get(path, [])
+
+        SupabaseAudioStorage(client).remove_prefix("run-1")
+
+        bucket.remove.assert_called_once_with([
+            "run-1/clips",
+            "run-1/metadata.csv",
+            "run-1/clips/a.wav",
+            "run-1/clips/b.wav",
+        ])
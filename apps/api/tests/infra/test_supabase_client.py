@@ -0,0 +1,47 @@
+"""Tests for the Supabase client factory."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from domain.exceptions import MissingConfigError
+from infra.clients import supabase
+
+ENV = {"SUPABASE_URL": "http://test", "SUPABASE_SERVICE_ROLE_KEY": "key"}
+
+
+class TestGetClient:
+    def test_raises_on_missing_config(self) -> None:
+        with (
+            patch.dict(os.environ, {"SUPABASE_URL": "", "SUPABASE_SERVICE_ROLE_KEY": ""}),
+            patch.object(supabase, "_load_env"),
+            pytest.raises(MissingConfigError),
+        ):
+            supabase.get_client()
+
+    def test_queries_go_through_shared_http2_client(self) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[{"id": "r1"}])
+
+        with (
+            patch.dict(os.environ, ENV),
+            patch.object(supabase.httpx, "Client", wraps=httpx.Client) as client_cls,
+        ):
+            client = supabase.get_client()
+
+        assert client_cls.call_args.kwargs["http2"] is True
+        client.options.httpx_client._transport = httpx.MockTransport(handler)
+
+        result = client.table("runs").select("*").execute()
+
+        assert result.data == [{"id": "r1"}]
+        assert requests[0].url.path == "/rest/v1/runs"
+        assert requests[0].headers["apikey"] == "key"
+        assert requests[0].headers["authorization"] == "Bearer key"
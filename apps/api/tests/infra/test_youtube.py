@@ -0,0 +1,105 @@
+"""Tests for the yt-dlp downloader."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from infra.clients.youtube import YouTubeDownloader
+
+
+def _install_fake_tool(bin_dir: Path, name: str, script: str) -> None:
+    tool = bin_dir / name
+    tool.write_text(f"#!/bin/sh\n{script}\n")
+    tool.chmod(0o755)
+
+
+@pytest.fixture
+def bin_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "bin"
+    path.mkdir()
+    # The fake ffmpeg copies stdin to its last argument, the output path.
+    _install_fake_tool(path, "ffmpeg", 'for last; do :; done\ncat > "$last"')
+    monkeypatch.setenv("PATH", f"{path}{os.pathsep}{os.environ['PATH']}")
+    return path
+
+
+class TestYouTubeDownloader:
+    def test_pipes_ytdlp_output_into_ffmpeg(self, bin_dir: Path, tmp_path: Path) -> None:
+        _install_fake_tool(bin_dir, "yt-dlp", "printf 'audio-bytes'")
+
+        out_path = YouTubeDownloader().download("https://yt/watch", tmp_path / "in", "talk")
+
+        assert out_path == tmp_path / "in" / "talk.wav"
+        assert out_path.read_bytes() == b"audio-bytes"
+
+    def test_raises_with_ytdlp_error(self, bin_dir: Path, tmp_path: Path) -> None:
+        _install_fake_tool(bin_dir, "yt-dlp", "echo 'ERROR: video unavailable' >&2\nexit 1")
+
+        with pytest.raises(RuntimeError, match="video unavailable"):
+            YouTubeDownloader().download("https://yt/watch", tmp_path / "in", "talk")
+
+        assert not (tmp_path / "in" / "talk.wav").exists()
+
+    def test_reports_ffmpeg_error_over_broken_pipe(self, bin_dir: Path, tmp_path: Path) -> None:
+        _install_fake_tool(bin_dir, "ffmpeg", "echo 'Invalid data found' >&2\nexit 1")
+        _install_fake_tool(bin_dir, "yt-dlp", "echo 'ERROR: Broken pipe' >&2\nexit 1")
+
+        with pytest.raises(RuntimeError, match="Invalid data found"):
+            YouTubeDownloader().download("https://yt/watch", tmp_path / "in", "talk")
+
+    def test_stops_ytdlp_when_ffmpeg_cannot_start(
+        self, bin_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _install_fake_tool(bin_dir, "yt-dlp", "while :; do printf x; done")
+        (bin_dir / "ffmpeg").unlink()
+        monkeypatch.setenv("PATH", str(bin_dir))
+
+        started: list[subprocess.Popen[bytes]] = []
+        real_popen = subprocess.Popen
+
+        def recording_popen(*args: Any, **kwargs: Any) -> subprocess.Popen[bytes]:
+            proc = real_popen(*args, **kwargs)
+            started.append(proc)
+            return proc
+
+        monkeypatch.setattr(subprocess, "Popen", recording_popen)
+
+        with pytest.raises(FileNotFoundError):
+            YouTubeDownloader().download("https://yt/watch", tmp_path / "in", "talk")
+
+        (ytdlp,) = started
+        assert ytdlp.returncode is not None
+
+    def test_falls_back_to_best_format(self, bin_dir: Path, tmp_path: Path) -> None:
+        calls = tmp_path / "calls.txt"
+        _install_fake_tool(bin_dir, "yt-dlp", f'echo "$@" >> {calls}\nprintf audio')
+
+        YouTubeDownloader().download("https://yt/watch", tmp_path / "in", "talk")
+
+        assert "-f bestaudio/best" in calls.read_text()
+
+    def test_blank_label_reuses_fetched_metadata(self, bin_dir: Path, tmp_path: Path) -> None:
+        calls = tmp_path / "calls.txt"
+        _install_fake_tool(
+            bin_dir,
+            "yt-dlp",
+            f'echo "$@" >> {calls}\n'
+            'if [ "$1" = "-J" ]; then echo \'{"title": "Salama Tompoko!"}\'; exit 0; fi\n'
+            "printf 'audio-bytes'",
+        )
+
+        out_path = YouTubeDownloader().download("https://yt/watch", tmp_path / "in", "")
+
+        assert out_path.name == "salama-tompoko.wav"
+        metadata_call, download_call = calls.read_text().splitlines()
+        assert metadata_call.startswith("-J")
+        assert "--load-info-json" in download_call
+        assert "https://yt/watch" not in download_call
+
+    def test_sanitize_builds_a_file_safe_label(self) -> None:
+        assert YouTubeDownloader._sanitize("  Salama  Tompoko! (Live) ") == "salama-tompoko-live"
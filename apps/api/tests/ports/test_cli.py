@@ -114,3 +114,13 @@ class TestCliRequestMapping:
         assert request.model_path == "models/whisper"
         assert request.device == "auto"
         assert request.language == "mg"
+
+
+class TestCliMain:
+    def test_cuda_oom_is_detected_when_torch_is_loaded(self) -> None:
+        import torch
+
+        assert cli_app._is_cuda_oom(torch.cuda.OutOfMemoryError("out of memory"))
+
+    def test_other_errors_are_not_cuda_oom(self) -> None:
+        assert not cli_app._is_cuda_oom(RuntimeError("boom"))